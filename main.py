@@ -16,19 +16,24 @@ os.environ.setdefault("PYTHONUTF8", "1")
 from fastapi import FastAPI, HTTPException, Cookie, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, Response
 import httpx
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from typing import List, Optional, Dict
-from pydantic import BaseModel, EmailStr
-import json
+from pydantic import BaseModel, ConfigDict, EmailStr
+from dataclasses import dataclass
+import orjson
 from pathlib import Path
 from datetime import datetime, timedelta
 import uuid
 import math
+import re
 import csv
 import asyncio
+import hashlib
 import zoneinfo
+from collections import OrderedDict
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 # Import authentication and database modules
@@ -54,15 +59,26 @@ if os.path.exists("static"):
 CACHE_FILE = Path("data/games_cache.json")
 ELO_RATINGS_FILE = Path("data/elo_ratings.csv")
 
+# Shared IMLeagues client so keep-alive connections survive across refreshes (closed on shutdown)
+HTTP_CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    http2=True,
+)
+
 # In-memory storage (use database in production)
 users: Dict[str, dict] = {}
 markets: Dict[str, dict] = {}
 user_positions: Dict[str, dict] = {}  # user_id -> {market_id: {home_shares, away_shares}}
-games_data = []  # Cached games loaded on startup (List[Game])
+games_data = []  # Cached games loaded on startup (List[GameRow])
 elo_data: Dict[str, Dict[str, float]] = {}  # sport -> team -> elo rating
 # chat_messages and raffle_entries are now persisted in SQLite (see database.py)
 raffle_closed: bool = False  # Loaded from DB on startup
 raffle_winners: List[dict] = []  # Loaded from DB on startup
+parsed_games_cache: "OrderedDict[bytes, tuple]" = OrderedDict()  # response digest -> parsed games (LRU)
+date_fetch_state: Dict[str, tuple] = {}  # date_str -> (ETag or None, parsed games) from the last good fetch
+refresh_inflight: Optional[asyncio.Task] = None  # Shared fetch_all_games task while a refresh is running
+games_cache_bytes: Optional[bytes] = None  # GamesResponse-shaped JSON body /api/games sends as-is (mirrors CACHE_FILE)
 
 # Admin
 ADMIN_USERNAME = "superuser"
@@ -81,6 +97,7 @@ LIQUIDITY_PARAMETER = 100  # For AMM pricing (b parameter in LMSR)
 MIN_INITIAL_SHARES = 500  # Minimum shares per side to ensure meaningful price movement
 ELO_BASE = 1000  # Default Elo rating for unknown teams
 REFRESH_INTERVAL_MINUTES = 30  # How often the background loop re-fetches games
+PARSE_CACHE_SIZE = 64  # Distinct IMLeagues responses whose parsed games are kept in memory
 
 # Team names that represent placeholder/unscheduled slots — never create markets for these
 GENERIC_TEAMS = {"tbd", "bye", "generic team", "unknown", "home", "away", "team", ""}
@@ -89,7 +106,9 @@ GENERIC_TEAMS = {"tbd", "bye", "generic team", "unknown", "home", "away", "team"
 # ============== MODELS ==============
 
 class Game(BaseModel):
-    """Game data model"""
+    """Game data model (API response schema — accepts GameRow instances directly)"""
+    model_config = ConfigDict(from_attributes=True)
+
     game_id: str
     home_team: str
     away_team: str
@@ -105,6 +124,24 @@ class Game(BaseModel):
     away_record: Optional[str] = None
 
 
+@dataclass(slots=True, frozen=True)
+class GameRow:
+    """Lightweight game record used by the parsers and in-memory caches"""
+    game_id: str
+    home_team: str
+    away_team: str
+    home_score: str
+    away_score: str
+    time: str
+    sport: str
+    status: str
+    date: Optional[str] = None
+    location: Optional[str] = None
+    league: Optional[str] = None
+    home_record: Optional[str] = None
+    away_record: Optional[str] = None
+
+
 class GamesResponse(BaseModel):
     """API response model"""
     success: bool
@@ -546,7 +583,7 @@ def is_market_closed(game_time: str, game_date: str) -> bool:
         return False
 
 
-def create_markets_from_games(games: List[Game]):
+def create_markets_from_games(games: List[GameRow]):
     """Create or update markets from game data"""
     for game in games:
         # Skip placeholder/BYE/TBD matchups
@@ -777,6 +814,45 @@ def push_stale_closed_markets():
     return pushed
 
 
+def save_games_cache(games: List[GameRow]):
+    """
+    Write games to the cache file so the next startup can seed from it.
+    The body is in GamesResponse shape and is also kept in memory so /api/games can send it as-is.
+    """
+    global games_cache_bytes
+    cache_data = {
+        'success': True,
+        'total_games': len(games),
+        'games': games,  # orjson serializes dataclasses natively
+        'message': f"Loaded {len(games)} games from cache",
+        'last_updated': datetime.now()
+    }
+    body = orjson.dumps(cache_data)
+    # Write compact JSON to a temp file and swap it in, so a crash mid-write never leaves a truncated cache
+    tmp_file = CACHE_FILE.with_suffix('.json.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, CACHE_FILE)
+    # An empty cache falls through to get_games' "No cached data found" response
+    games_cache_bytes = body if games else None
+
+
+def load_games_cache() -> List[GameRow]:
+    """Read games back from the cache file"""
+    global games_cache_bytes
+    with open(CACHE_FILE, 'rb') as f:
+        body = f.read()
+    data = orjson.loads(body)
+    # Cache files from older versions lack the response fields and must go through the slow path
+    servable = 'success' in data and 'total_games' in data and bool(data.get('games'))
+    games_cache_bytes = body if servable else None
+    # Ignore unknown keys (as Game(**game) used to) so older or newer cache files still load
+    fields = GameRow.__slots__
+    return [GameRow(**{k: v for k, v in game.items() if k in fields}) for game in data.get('games', [])]
+
+
 # ============== API ENDPOINTS ==============
 
 
@@ -1403,23 +1479,40 @@ async def get_portfolio(user: Optional[Dict] = Depends(get_current_user)):
 
 
 @app.get("/api/games", response_model=GamesResponse)
-async def get_games():
+async def get_games(validate: bool = False):
     """
     Get games from memory (loaded from cache on startup)
     Use /api/games/refresh to fetch fresh data from API
+    
+    The cached body is already in response shape, so it is sent as-is from memory.
+    Pass ?validate=1 (debugging) to run every in-memory game through the Game schema instead.
     """
     
     try:
+        # A single immutable bytes object — a refresh swapping it mid-request can't tear the body
+        if not validate and games_cache_bytes is not None:
+            return Response(games_cache_bytes, media_type="application/json")
+        
         # Return from in-memory games data
         if games_data:
             print(f"Returning {len(games_data)} games from memory")
             
-            return GamesResponse(
-                success=True,
-                total_games=len(games_data),
-                games=games_data,
-                message=f"Loaded {len(games_data)} games from cache"
-            )
+            if validate:
+                return GamesResponse(
+                    success=True,
+                    total_games=len(games_data),
+                    games=games_data,
+                    message=f"Loaded {len(games_data)} games from cache"
+                )
+            
+            # Serialize the GameRow dataclasses straight to JSON with orjson,
+            # skipping per-game Pydantic validation and the stdlib encoder
+            return ORJSONResponse({
+                "success": True,
+                "total_games": len(games_data),
+                "games": games_data,
+                "message": f"Loaded {len(games_data)} games from cache"
+            })
         else:
             return GamesResponse(
                 success=False,
@@ -1454,17 +1547,10 @@ async def refresh_games():
     
     try:
         # Fetch games from API
-        games = await fetch_all_games()
+        games = await fetch_all_games_coalesced()
         
         # Save to cache file
-        cache_data = {
-            'games': [game.dict() for game in games],
-            'count': len(games),
-            'last_updated': str(datetime.now())
-        }
-        
-        with open(CACHE_FILE, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        save_games_cache(games)
         
         # Update global games data and create/update markets
         global games_data
@@ -1491,16 +1577,28 @@ async def refresh_games():
         )
 
 
-async def fetch_all_games() -> List[Game]:
+async def fetch_all_games_coalesced() -> List[GameRow]:
+    """
+    Run fetch_all_games, letting concurrent callers share a single in-flight fetch
+    (e.g. two /api/games/refresh hits, or a refresh racing the background loop)
+    """
+    global refresh_inflight
+    # No await between the check and create_task, so no lock is needed on the event loop
+    if refresh_inflight is None or refresh_inflight.done():
+        refresh_inflight = asyncio.create_task(fetch_all_games())
+    # Shield so one caller's cancellation (client disconnect) doesn't cancel everyone's fetch
+    return await asyncio.shield(refresh_inflight)
+
+
+async def fetch_all_games() -> List[GameRow]:
     """
     Fetch games for each day in our date range using AjaxSearchGamesForSPAManageGames endpoint
     This is more efficient as it only fetches the exact dates we need (last 3 days + next 7 days)
+    All days are requested concurrently, so a refresh costs roughly one round trip
     
     Returns:
-        List of Game objects
+        List of GameRow objects
     """
-    from datetime import datetime, timedelta
-    
     # Calculate date range: last 3 days to next 7 days
     today = datetime.now().date()
     start_date = today - timedelta(days=3)
@@ -1508,37 +1606,51 @@ async def fetch_all_games() -> List[Game]:
     
     all_games = []
     
-    # Fetch games for each day in the range
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        print(f"\n=== Fetching games from {start_date} to {end_date} (day by day) ===")
-        
-        current_date = start_date
-        while current_date <= end_date:
-            date_str = current_date.strftime("%m/%d/%Y").lstrip("0").replace("/0", "/")
-            
-            # Fetch games for this specific date
-            games = await fetch_games_for_specific_date(client, date_str)
-            
-            if games:
-                print(f"  {date_str}: {len(games)} games")
-                all_games.extend(games)
-            
-            current_date += timedelta(days=1)
+    # Build the list of days in the range
+    date_strs = []
+    current_date = start_date
+    while current_date <= end_date:
+        date_strs.append(f"{current_date.month}/{current_date.day}/{current_date.year}")
+        current_date += timedelta(days=1)
+    
+    # Forget dates that have rolled out of the window
+    for stale_date in set(date_fetch_state) - set(date_strs):
+        del date_fetch_state[stale_date]
+    
+    # Fetch all days concurrently over the shared client
+    print(f"\n=== Fetching games from {start_date} to {end_date} ({len(date_strs)} days concurrently) ===")
+    results = await asyncio.gather(
+        *(fetch_games_for_specific_date(HTTP_CLIENT, date_str) for date_str in date_strs),
+        return_exceptions=True
+    )
+    
+    for date_str, games in zip(date_strs, results):
+        if isinstance(games, Exception):
+            print(f"Error fetching games for {date_str}: {games}")
+            continue
         
-        print(f"Total games fetched: {len(all_games)}")
-        return all_games
+        if games:
+            print(f"  {date_str}: {len(games)} games")
+            all_games.extend(games)
+    
+    print(f"Total games fetched: {len(all_games)}")
+    return all_games
 
 
-async def fetch_games_for_specific_date(client: httpx.AsyncClient, date_str: str) -> List[Game]:
+async def fetch_games_for_specific_date(client: httpx.AsyncClient, date_str: str) -> List[GameRow]:
     """
     Fetch games for a specific date
     
+    Repeat fetches send the last ETag as If-None-Match; a 304 reuses the games
+    parsed last time without touching the JSON or HTML parsers. Past dates are
+    still revalidated every refresh so late-entered scores get picked up.
+    
     Args:
         client: httpx AsyncClient to reuse connection
         date_str: Date string in format M/D/YYYY (e.g., "2/15/2026")
         
     Returns:
-        List of Game objects for that date
+        List of GameRow objects for that date
     """
     url = "https://www.imleagues.com/AjaxPageRequestHandler.aspx"
     
@@ -1549,6 +1661,7 @@ async def fetch_games_for_specific_date(client: httpx.AsyncClient, date_str: str
     
     headers = {
         "Accept": "application/json, text/plain, */*",
+        "Accept-Encoding": "br, gzip",  # Compressed HTML payloads; httpx decodes them (br needs `brotli`)
         "Accept-Language": "en-US,en;q=0.9",
         "Content-Type": "application/json;charset=UTF-8",
         "Origin": "https://www.imleagues.com",
@@ -1578,20 +1691,39 @@ async def fetch_games_for_specific_date(client: httpx.AsyncClient, date_str: str
         "NewViewMode": 0  # Key: 0 = single date, 2 = full month
     }
     
+    previous = date_fetch_state.get(date_str)
+    if previous is not None:
+        previous_etag, previous_games = previous
+        if previous_etag:
+            headers["If-None-Match"] = previous_etag
+    
     try:
         response = await client.post(url, params=params, json=payload, headers=headers)
+        
+        # Unchanged since our last fetch (checked first — raise_for_status treats 3xx as an error)
+        if response.status_code == 304 and previous is not None:
+            return list(previous_games)
+        
         response.raise_for_status()
         
-        data = response.json()
+        etag = response.headers.get("ETag")
         
-        if not data.get('Data'):
-            return []
+        # Past dates rarely change — if we've parsed this exact response before, reuse it
+        body_digest = hashlib.blake2b(response.content, digest_size=16).digest()
+        cached_games = get_cached_parsed_games(body_digest)
+        if cached_games is not None:
+            date_fetch_state[date_str] = (etag, cached_games)
+            return list(cached_games)
         
-        html_content = data['Data']
+        data = orjson.loads(response.content)
         
-        # Parse HTML with BeautifulSoup
-        games = parse_games_html_with_dates(html_content)
+        if not data.get('Data'):
+            games = []
+        else:
+            games = parse_games_html_with_dates(data['Data'])
         
+        cache_parsed_games(body_digest, games)
+        date_fetch_state[date_str] = (etag, tuple(games))
         return games
         
     except Exception as e:
@@ -1599,79 +1731,104 @@ async def fetch_games_for_specific_date(client: httpx.AsyncClient, date_str: str
         return []
 
 
-async def fetch_games_for_date(date_str: str) -> List[Game]:
+def get_cached_parsed_games(body_digest: bytes) -> Optional[tuple]:
+    """Return the games parsed from a response with this digest, or None if not cached"""
+    games = parsed_games_cache.get(body_digest)
+    if games is not None:
+        parsed_games_cache.move_to_end(body_digest)
+    return games
+
+
+def cache_parsed_games(body_digest: bytes, games: List[GameRow]):
+    """Remember parsed games for a response digest, evicting the least recently used entry"""
+    parsed_games_cache[body_digest] = tuple(games)
+    parsed_games_cache.move_to_end(body_digest)
+    while len(parsed_games_cache) > PARSE_CACHE_SIZE:
+        parsed_games_cache.popitem(last=False)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains `name` (like CSS `.name`)"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Compiled once at import — parse_games_html_with_dates runs these for every game on every refresh
+XP_DATE_SECTIONS = etree.XPath('descendant-or-self::div[@gameday]')
+XP_MATCH = etree.XPath(f'.//div[{_has_class("match")}]')
+# Per team .media container: the class of its first team link, and the first
+# muted <small> in its first .media-body (where IMLeagues puts the W-L-T record)
+XP_MEDIA = etree.XPath(f'.//div[{_has_class("media")}]')
+XP_MEDIA_TEAM_CLASS = etree.XPath(
+    f'string((.//*[{_has_class("teamHome")} or {_has_class("teamAway")}])[1]/@class)'
+)
+XP_MEDIA_RECORD = etree.XPath(
+    f'((.//*[{_has_class("media-body")}])[1]//small[{_has_class("text-muted")}])[1]'
+)
+XP_TEXT = etree.XPath('.//text()', smart_strings=False)
+FORFEIT_RE = re.compile(r'forfeit|default', re.IGNORECASE)
+
+# Per-game fields located by _index_match: class -> (required tag or None, field).
+# The first descendant in document order wins, matching the old select_one() semantics.
+MATCH_FIELD_CLASSES = {
+    'iml-team-left': ('div', 'home_container'),
+    'iml-team-right': ('div', 'away_container'),
+    'teamHome': (None, 'home_team'),
+    'teamAway': (None, 'away_team'),
+    'match-team1Score': (None, 'home_score'),
+    'match-team2Score': (None, 'away_score'),
+    'text-muted': ('small', 'muted'),
+    'status': ('span', 'time'),
+    'iml-game-time': (None, 'time'),
+    'match-time': (None, 'time'),
+    'time': (None, 'time'),
+    'match-facility': (None, 'facility'),
+    'iml-game-court': (None, 'court'),
+}
+
+
+def _index_match(game_elem) -> Dict[str, etree._Element]:
     """
-    Fetch games for a specific date
-    
-    Args:
-        date_str: Date string in format MM/DD/YYYY
-        
-    Returns:
-        List of Game objects
+    Walk a match element once and return the first element for each field in
+    MATCH_FIELD_CLASSES, plus the first sport and league links
     """
-    # IMLeagues API endpoint
-    url = "https://www.imleagues.com/Services/AjaxRequestHandler.ashx"
-    
-    params = {
-        "class": "imLeagues.Web.Members.Services.BO.Network.ManageGamesBO",
-        "method": "Initialize",
-        "paramType": "imLeagues.Internal.API.VO.Input.Network.ManageGamesViewInVO",
-        "urlReferrer": "https://www.imleagues.com/spa/intramural/13cc30785f6f4658aebbb07d83e19f67/managegames"
-    }
-    
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "Accept-Language": "en-US,en;q=0.9",
-        "Content-Type": "application/json;charset=UTF-8",
-        "Origin": "https://www.imleagues.com",
-        "Referer": "https://www.imleagues.com/spa/intramural/13cc30785f6f4658aebbb07d83e19f67/managegames",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/145.0.0.0 Safari/537.36",
-    }
-    
-    payload = {
-        "entityId": "13cc30785f6f4658aebbb07d83e19f67",
-        "entityType": "intramural",
-        "pageType": "Intramural",
-        "resultsFilter": 0,
-        "clientVersion": "572",
-        "isMobileDevice": True,
-        "isSSO": False,
-        "cachedKey": None,
-        "clientType": 0,
-        "selectedDate": date_str  # Add the date parameter
-    }
-    
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            print(f"\n=== Fetching games for date: {date_str} ===")
-            print(f"Payload: {payload}")
-            
-            response = await client.post(url, params=params, json=payload, headers=headers)
-            response.raise_for_status()
-            
-            # Parse JSON response
-            data = response.json()
-            
-            # Extract HTML from the nested structure
-            if "data" not in data or "manageGamesUCHtml" not in data["data"]:
-                print(f"No games HTML found for {date_str}")
-                return []
-            
-            html_content = data["data"]["manageGamesUCHtml"]
-            print(f"HTML length for {date_str}: {len(html_content)} characters")
-            
-            # Parse HTML with BeautifulSoup
-            games = parse_games_html(html_content, date_str)
-            print(f"Parsed {len(games)} games for {date_str}")
-            
-            return games
-            
-    except Exception as e:
-        print(f"Error fetching games for {date_str}: {e}")
-        return []
+    found = {}
+    for elem in game_elem.iterdescendants(etree.Element):
+        tag = elem.tag
+        if tag == 'a':
+            href = elem.get('href')
+            if href:
+                if 'sport' not in found and '/sport/' in href:
+                    found['sport'] = elem
+                if 'league' not in found and '/league/' in href:
+                    found['league'] = elem
+        
+        classes = elem.get('class')
+        if not classes:
+            continue
+        for name in classes.split():
+            spec = MATCH_FIELD_CLASSES.get(name)
+            if spec is None:
+                continue
+            required_tag, field = spec
+            if field not in found and (required_tag is None or required_tag == tag):
+                found[field] = elem
+    return found
+
+
+def _first_link_with_class(container, name: str) -> Optional[etree._Element]:
+    """Return the first <a> under container carrying the given class, or None"""
+    for link in container.iterdescendants('a'):
+        if name in link.get('class', '').split():
+            return link
+    return None
+
 
+def _text(elem) -> str:
+    """Concatenate stripped descendant text, matching BeautifulSoup's get_text(strip=True)"""
+    return "".join(t.strip() for t in XP_TEXT(elem))
 
-def parse_games_html_with_dates(html_content: str) -> List[Game]:
+
+def parse_games_html_with_dates(html_content: str) -> List[GameRow]:
     """
     Parse the HTML string to extract game information with proper date grouping
     
@@ -1679,13 +1836,16 @@ def parse_games_html_with_dates(html_content: str) -> List[Game]:
         html_content: HTML string from the API response
         
     Returns:
-        List of Game objects with proper dates from gameday attribute
+        List of GameRow objects with proper dates from gameday attribute
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
     games = []
+    if not html_content or not html_content.strip():
+        return games
+    
+    root = lxml_html.fromstring(html_content)
     
     # Find all date sections (divs with gameday attribute)
-    date_sections = soup.select('div[gameday]')
+    date_sections = XP_DATE_SECTIONS(root)
     
     print(f"Found {len(date_sections)} date sections")
     
@@ -1695,7 +1855,7 @@ def parse_games_html_with_dates(html_content: str) -> List[Game]:
         
         # Find all game containers within this date section
         # Use more flexible selector to catch all games
-        game_elements = date_section.select('div.match')
+        game_elements = XP_MATCH(date_section)
         
         print(f"  Date {current_date}: {len(game_elements)} games")
         
@@ -1704,128 +1864,107 @@ def parse_games_html_with_dates(html_content: str) -> List[Game]:
                 # Extract game ID from data-id attribute
                 game_id = game_elem.get('data-id', '')
                 
-                # Try multiple selectors for teams to handle different HTML structures
-                # First try the specific structure with iml-team-left/right
-                home_team_container = game_elem.select_one('div.iml-team-left')
-                home_team_elem = home_team_container.select_one('a.teamHome') if home_team_container else None
-                
-                # Fallback to direct selector if specific structure not found
-                if not home_team_elem:
-                    home_team_elem = game_elem.select_one('a.teamHome, .teamHome')
+                # Locate every field we need in a single pass over the match subtree
+                fields = _index_match(game_elem)
                 
-                away_team_container = game_elem.select_one('div.iml-team-right')
-                away_team_elem = away_team_container.select_one('a.teamAway') if away_team_container else None
+                # Try multiple selectors for teams to handle different HTML structures
+                # First try the specific structure with iml-team-left/right,
+                # falling back to any teamHome/teamAway element if not found
+                home_container = fields.get('home_container')
+                home_team_elem = _first_link_with_class(home_container, 'teamHome') if home_container is not None else None
+                if home_team_elem is None:
+                    home_team_elem = fields.get('home_team')
                 
-                # Fallback to direct selector if specific structure not found
-                if not away_team_elem:
-                    away_team_elem = game_elem.select_one('a.teamAway, .teamAway')
+                away_container = fields.get('away_container')
+                away_team_elem = _first_link_with_class(away_container, 'teamAway') if away_container is not None else None
+                if away_team_elem is None:
+                    away_team_elem = fields.get('away_team')
                 
-                if not home_team_elem or not away_team_elem:
+                if home_team_elem is None or away_team_elem is None:
                     continue
                 
-                home_team = home_team_elem.get_text(strip=True)
-                away_team = away_team_elem.get_text(strip=True)
+                home_team = _text(home_team_elem)
+                away_team = _text(away_team_elem)
                 
-                # Extract scores - CRITICAL: Use .get_text() to recursively extract from nested spans
+                # Extract scores - CRITICAL: collect all descendant text
                 # The score might be directly in <strong> OR nested in <span class='match-win'>
-                home_score_elem = game_elem.select_one('strong.match-team1Score, .match-team1Score')
-                away_score_elem = game_elem.select_one('strong.match-team2Score, .match-team2Score')
+                home_score_elem = fields.get('home_score')
+                away_score_elem = fields.get('away_score')
                 
-                # Use .get_text(strip=True) to recursively extract text from nested elements
-                home_score_text = home_score_elem.get_text(strip=True) if home_score_elem else "--"
-                away_score_text = away_score_elem.get_text(strip=True) if away_score_elem else "--"
+                home_score_text = _text(home_score_elem) if home_score_elem is not None else "--"
+                away_score_text = _text(away_score_elem) if away_score_elem is not None else "--"
                 
                 # Check for forfeit/default indicators
-                forfeit_elem = game_elem.select_one('small.text-muted')
-                forfeit_text = forfeit_elem.get_text(strip=True).lower() if forfeit_elem else ""
-                is_forfeit = 'forfeit' in forfeit_text or 'default' in forfeit_text
+                forfeit_elem = fields.get('muted')
+                is_forfeit = forfeit_elem is not None and FORFEIT_RE.search(_text(forfeit_elem)) is not None
                 
-                # Determine status based on score values and forfeit status
-                if home_score_text == "--" and away_score_text == "--":
-                    if is_forfeit:
-                        status = "forfeit"
-                        home_score = "--"
-                        away_score = "--"
-                    else:
-                        status = "scheduled"
-                        home_score = "--"
-                        away_score = "--"
+                # Determine status based on score values; a forfeit/default marker overrides it
+                home_score = home_score_text
+                away_score = away_score_text
+                if is_forfeit:
+                    status = "forfeit"
+                elif home_score_text == "--" and away_score_text == "--":
+                    status = "scheduled"
                 elif home_score_text.isdigit() and away_score_text.isdigit():
-                    if is_forfeit:
-                        status = "forfeit"
-                    else:
-                        status = "completed"
-                    home_score = home_score_text
-                    away_score = away_score_text
+                    status = "completed"
                 else:
                     # Handle partial scores or other edge cases
-                    if is_forfeit:
-                        status = "forfeit"
-                    else:
-                        status = "unknown"
-                    home_score = home_score_text
-                    away_score = away_score_text
+                    status = "unknown"
                 
                 # Extract time — IMLeagues uses span.status for scheduled time
                 # (it shows the kickoff time for future games, e.g. "7:00 PM",
                 #  and "FINAL" for completed ones — we keep whatever string is there)
-                time_elem = game_elem.select_one('span.status, .iml-game-time, .match-time, .time')
-                game_time = time_elem.get_text(strip=True) if time_elem else "TBD"
+                time_elem = fields.get('time')
+                game_time = _text(time_elem) if time_elem is not None else "TBD"
                 # Normalise: blank or placeholder strings → TBD
                 if not game_time or game_time in ("-", "--"):
                     game_time = "TBD"
                 
                 # Extract sport (from the sport link)
-                sport_elem = game_elem.select_one('a[href*="/sport/"]')
-                sport = sport_elem.get_text(strip=True) if sport_elem else "Unknown"
+                sport_elem = fields.get('sport')
+                sport = _text(sport_elem) if sport_elem is not None else "Unknown"
                 
                 # Extract location/venue (facility + court)
-                facility_elem = game_elem.select_one('.match-facility')
-                court_elem = game_elem.select_one('.iml-game-court')
+                facility_elem = fields.get('facility')
+                court_elem = fields.get('court')
                 
-                if facility_elem and court_elem:
-                    facility = facility_elem.get_text(strip=True)
-                    court = court_elem.get_text(strip=True)
+                if facility_elem is not None and court_elem is not None:
+                    facility = _text(facility_elem)
+                    court = _text(court_elem)
                     location = f"{facility}, {court}"
-                elif facility_elem:
-                    location = facility_elem.get_text(strip=True)
+                elif facility_elem is not None:
+                    location = _text(facility_elem)
                 else:
                     location = None
                 
                 # Extract league info
-                league_elem = game_elem.select_one('a[href*="/league/"]')
-                league = league_elem.get_text(strip=True) if league_elem else None
+                league_elem = fields.get('league')
+                league = _text(league_elem) if league_elem is not None else None
                 
                 # Extract team records (W-L-T format)
                 # Records are in <small class="text-muted"> within each team's .media container
                 home_record = None
                 away_record = None
                 
-                # Find all .media containers within the game (one for home, one for away)
-                team_media_containers = game_elem.find_all('div', class_='media')
-                
-                # The first .media should be home team, second should be away team
-                for media in team_media_containers:
-                    # Check if this media contains the home team or away team
-                    team_link = media.select_one('.teamHome, .teamAway')
-                    if not team_link:
+                # Each team's .media holds its link (teamHome/teamAway) and, in the
+                # first .media-body, a muted <small> with the record
+                for media in XP_MEDIA(game_elem):
+                    team_classes = XP_MEDIA_TEAM_CLASS(media).split()
+                    if not team_classes:
                         continue
                     
-                    # Find the record in this media's body
-                    media_body = media.select_one('.media-body')
-                    if media_body:
-                        record_elem = media_body.select_one('small.text-muted')
-                        if record_elem:
-                            record_text = record_elem.get_text(strip=True)
-                            # Only capture if it looks like a record (contains digits and hyphens)
-                            if '-' in record_text and '(' in record_text:
-                                # Determine if this is home or away based on the team class
-                                if 'teamHome' in team_link.get('class', []):
-                                    home_record = record_text
-                                elif 'teamAway' in team_link.get('class', []):
-                                    away_record = record_text
+                    record_elems = XP_MEDIA_RECORD(media)
+                    if not record_elems:
+                        continue
+                    record_text = _text(record_elems[0])
+                    # Only capture if it looks like a record (contains digits and hyphens)
+                    if '-' in record_text and '(' in record_text:
+                        if 'teamHome' in team_classes:
+                            home_record = record_text
+                        elif 'teamAway' in team_classes:
+                            away_record = record_text
                 
-                game = Game(
+                game = GameRow(
                     game_id=game_id,
                     home_team=home_team,
                     away_team=away_team,
@@ -1851,110 +1990,6 @@ def parse_games_html_with_dates(html_content: str) -> List[Game]:
     return games
 
 
-def parse_games_html(html_content: str, date_str: str = None) -> List[Game]:
-    """
-    Parse the HTML string to extract game information
-    
-    Args:
-        html_content: HTML string from the API response
-        date_str: Date string to use for all games (passed from fetch_games_for_date)
-        
-    Returns:
-        List of Game objects
-    """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    games = []
-    
-    # Use the date_str parameter that was passed in, which corresponds to the date we requested
-    # Don't extract from HTML as it may not reflect the selectedDate parameter
-    current_date = date_str
-    
-    # Only fall back to HTML if date_str wasn't provided
-    if not current_date:
-        date_elem = soup.select_one('#pNowDate')
-        current_date = date_elem.get_text(strip=True) if date_elem else None
-    
-    if not current_date:
-        game_day_elem = soup.select_one('[gameday]')
-        if game_day_elem:
-            current_date = game_day_elem.get('gameday')
-    
-    # Find all game containers (divs with class 'match')
-    game_elements = soup.select('div.match')
-    
-    for game_elem in game_elements:
-        try:
-            # Extract game ID
-            game_id = game_elem.get('data-id', '')
-            
-            # Extract teams
-            home_team_elem = game_elem.select_one('.teamHome')
-            away_team_elem = game_elem.select_one('.teamAway')
-            
-            if not home_team_elem or not away_team_elem:
-                continue
-            
-            home_team = home_team_elem.get_text(strip=True)
-            away_team = away_team_elem.get_text(strip=True)
-            
-            # Extract scores
-            home_score_elem = game_elem.select_one('.match-team1Score')
-            away_score_elem = game_elem.select_one('.match-team2Score')
-            
-            home_score = home_score_elem.get_text(strip=True) if home_score_elem else "--"
-            away_score = away_score_elem.get_text(strip=True) if away_score_elem else "--"
-            
-            # Extract time
-            time_elem = game_elem.select_one('.time')
-            game_time = time_elem.get_text(strip=True) if time_elem else "TBD"
-            
-            # Extract sport (from the sport link)
-            sport_elem = game_elem.select_one('a[href*="/sport/"]')
-            sport = sport_elem.get_text(strip=True) if sport_elem else "Unknown"
-            
-            # Extract location/venue
-            location_elem = game_elem.select_one('.location, .venue')
-            location = location_elem.get_text(strip=True) if location_elem else None
-            
-            # Extract league info
-            league_elem = game_elem.select_one('a[href*="/league/"]')
-            league = league_elem.get_text(strip=True) if league_elem else None
-            
-            # Determine status
-            if home_score == "--" or away_score == "--":
-                status = "scheduled"
-            elif home_score.isdigit() and away_score.isdigit():
-                # Check if game is complete or in progress
-                # For now, assume any game with scores is complete
-                # You could add more logic here based on additional fields
-                status = "completed"
-            else:
-                status = "unknown"
-            
-            game = Game(
-                game_id=game_id,
-                home_team=home_team,
-                away_team=away_team,
-                home_score=home_score,
-                away_score=away_score,
-                time=game_time,
-                date=current_date,
-                sport=sport,
-                status=status,
-                location=location,
-                league=league
-            )
-            
-            games.append(game)
-            
-        except Exception as e:
-            # Skip games that fail to parse
-            print(f"Error parsing game: {e}")
-            continue
-    
-    return games
-
-
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint"""
@@ -2207,11 +2242,9 @@ async def startup_event():
     # Seed from cache immediately so the server is ready before the first live fetch
     if CACHE_FILE.exists():
         print(f"Seeding from cache: {CACHE_FILE}")
-        with open(CACHE_FILE, 'r') as f:
-            data = json.load(f)
-            games_data = [Game(**game) for game in data.get('games', [])]
-            create_markets_from_games(games_data)
-            print(f"Seeded {len(games_data)} games and {len(db.get_all_markets())} markets from cache")
+        games_data = load_games_cache()
+        create_markets_from_games(games_data)
+        print(f"Seeded {len(games_data)} games and {len(db.get_all_markets())} markets from cache")
     else:
         print("No cache file found. Will fetch from API...")
 
@@ -2249,21 +2282,21 @@ async def startup_event():
         print(f"[startup] Admin user '{ADMIN_USERNAME}' already registered")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the shared IMLeagues HTTP client"""
+    await HTTP_CLIENT.aclose()
+
+
 async def _do_game_refresh(label: str = "refresh"):
     """Shared logic: fetch games, update cache and markets, push stale markets."""
     global games_data
     try:
         print(f"[{label}] Fetching live games from IMLeagues...")
-        fresh_games = await fetch_all_games()
+        fresh_games = await fetch_all_games_coalesced()
         if fresh_games:
             games_data = fresh_games
-            cache_data = {
-                'games': [g.dict() for g in fresh_games],
-                'count': len(fresh_games),
-                'last_updated': str(datetime.now())
-            }
-            with open(CACHE_FILE, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            save_games_cache(fresh_games)
             create_markets_from_games(games_data)
             print(f"[{label}] Updated {len(fresh_games)} games")
         else: